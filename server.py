@@ -5,81 +5,421 @@ A Model Context Protocol server for querying and managing Equinix Fabric infrast
 
 import os
 import json
+import time
+import random
 import asyncio
-from typing import Any, Optional, Dict, List
-from datetime import datetime
+import logging
+import inspect
+import importlib.util
+import urllib.request
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Dict
 import httpx
 from mcp.server import Server
+from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import jsonschema
+except ImportError:  # shipped with MCP SDKs that validate tool input
+    jsonschema = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # optional speedup, not available on Windows
+    uvloop = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
 # Initialize the MCP server
 app = Server("equinix-fabric")
 
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean environment variable (1/true/yes or 0/false/no)"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    lowered = value.lower()
+    if lowered in ("1", "true", "yes"):
+        return True
+    if lowered in ("0", "false", "no"):
+        return False
+    raise ValueError(f"{name} must be one of 1/true/yes or 0/false/no, got {value!r}")
+
+def _env_number(
+    name: str,
+    default: float,
+    cast: Callable[[str], Any] = float,
+    minimum: Optional[float] = None,
+    above: Optional[float] = None
+) -> Any:
+    """Read a numeric environment variable, failing loudly on malformed or out-of-range values"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+    if minimum is not None and number < minimum:
+        raise ValueError(f"{name} must be at least {minimum}, got {value!r}")
+    if above is not None and number <= above:
+        raise ValueError(f"{name} must be greater than {above}, got {value!r}")
+    return number
+
 # API Configuration
 API_BASE_URL = "https://api.equinix.com"
 OAUTH_URL = f"{API_BASE_URL}/oauth2/v1/token"
 
+# Tool results are compact JSON unless pretty-printing is requested
+PRETTY_JSON = _env_flag("EQUINIX_MCP_PRETTY", False)
+
+# HTTP connection pool configuration (tunable per deployment)
+HTTP_TIMEOUT = _env_number("EQUINIX_HTTP_TIMEOUT", 30.0, above=0)
+HTTP_LIMITS = httpx.Limits(
+    # A pool of zero connections makes every request end in PoolTimeout
+    max_connections=_env_number("EQUINIX_HTTP_MAX_CONNECTIONS", 64, int, minimum=1),
+    max_keepalive_connections=_env_number("EQUINIX_HTTP_MAX_KEEPALIVE", 32, int, minimum=0),
+    keepalive_expiry=60.0
+)
+# HTTP/2 multiplexes concurrent calls over one connection; it needs the
+# optional h2 package (httpx[http2]), so fall back to HTTP/1.1 without it
+HTTP2_ENABLED = _env_flag("EQUINIX_HTTP2", True) and importlib.util.find_spec("h2") is not None
+
+# Request concurrency and retry configuration
+# A zero-sized semaphore would block every request forever
+MAX_CONCURRENT_REQUESTS = _env_number("EQUINIX_MAX_CONCURRENT_REQUESTS", 32, int, minimum=1)
+MAX_RETRIES = 3
+# Connection failures (refused, reset during connect) retried by the transport
+TRANSPORT_RETRIES = 3
+# A rate-limited request was rejected unprocessed, so any method may retry it
+RETRY_STATUS_CODES = frozenset({429})
+# 502/503/504 can come from a gateway after the API processed the request, so
+# only idempotent calls replay them; a second POST could create a duplicate
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+IDEMPOTENT_RETRY_STATUS_CODES = RETRY_STATUS_CODES | {502, 503, 504}
+RETRY_BACKOFF_BASE = 0.5
+RETRY_MAX_DELAY = 30.0
+# Random spread added to computed backoff so concurrent retries don't align
+RETRY_JITTER = 0.1
+
+# Slow-changing reference data is cached in-process (TTL in seconds)
+METROS_CACHE_TTL = 3600.0
+SERVICE_PROFILE_CACHE_TTL = 600.0
+SERVICE_PROFILES_LIST_CACHE_TTL = 300.0
+ROUTER_CACHE_TTL = 300.0
+PORT_CACHE_TTL = 60.0
+GET_CACHE_MAX_ENTRIES = 256
+
+# Only requests that carry a body declare a content type
+_JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+# Process-wide HTTP client, bound to the event loop it was created on
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _env_proxy(url: str) -> Optional[httpx.Proxy]:
+    """Proxy for url from HTTPS_PROXY/ALL_PROXY, unless NO_PROXY excludes it"""
+    proxies = urllib.request.getproxies()
+    proxy_url = proxies.get("https") or proxies.get("all")
+    if not proxy_url:
+        return None
+    if urllib.request.proxy_bypass(httpx.URL(url).host):
+        return None
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    return httpx.Proxy(proxy_url)
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, recreating it if the event loop changed"""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        transport = httpx.AsyncHTTPTransport(
+            retries=TRANSPORT_RETRIES,
+            limits=HTTP_LIMITS,
+            http2=HTTP2_ENABLED,
+            # httpx ignores proxy env vars once a transport is supplied
+            proxy=_env_proxy(API_BASE_URL)
+        )
+        _http_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=HTTP_TIMEOUT,
+            headers={"accept": "application/json"}
+        )
+        _http_client_loop = loop
+    return _http_client
+
+async def _close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections"""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode a request body as compact JSON bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a tool result as JSON, preferring orjson when installed"""
+    if orjson is not None:
+        if PRETTY_JSON:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        return orjson.dumps(obj).decode()
+    if PRETTY_JSON:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring a numeric Retry-After header"""
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    backoff = min(RETRY_BACKOFF_BASE * 2.0 ** attempt, RETRY_MAX_DELAY)
+    return backoff + random.uniform(0, RETRY_JITTER)
+
 class EquinixClient:
     """Client for Equinix Fabric API"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    # Absolute Fabric v4 endpoint URLs, built once so requests skip URL joining
+    _URL_PORTS = f"{API_BASE_URL}/fabric/v4/ports"
+    _URL_CONNECTIONS = f"{API_BASE_URL}/fabric/v4/connections"
+    _URL_ROUTERS = f"{API_BASE_URL}/fabric/v4/routers"
+    _URL_METROS = f"{API_BASE_URL}/fabric/v4/metros"
+    _URL_SERVICE_PROFILES = f"{API_BASE_URL}/fabric/v4/serviceProfiles"
+    _URL_SERVICE_TOKENS = f"{API_BASE_URL}/fabric/v4/serviceTokens"
+    
+    # (input key, JSON Patch path, optional value transform) for update_connection
+    _PATCH_FIELDS = (
+        ("name", "/name", None),
+        ("description", "/description", None),
+        ("bandwidth", "/bandwidth", None),
+        ("notifications", "/notifications", lambda v: [{"type": "ALL", "emails": v}]),
+    )
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
+        # Credentials never change, so serialize the token request body once
+        self._oauth_body = _json_bytes({
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret
+        })
         self.access_token: Optional[str] = None
         self.token_expiry: float = 0
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self._token_lock = asyncio.Lock()
+        self._auth_headers: Dict[str, str] = {}
+        self._auth_json_headers: Dict[str, str] = {}
+        # Bound in-flight API requests to stay clear of Fabric rate limits
+        self._req_sem = asyncio.Semaphore(max_concurrency)
+        self._get_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        # Cleared once the API answers GET /fabric/v4/routers/{uuid} with 405
+        self._routers_direct_get = True
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared connection-pooled HTTP client"""
+        return _get_http_client()
+    
+    async def aclose(self) -> None:
+        """Drop this client's cached token and responses"""
+        # The connection pool is shared by every client, so it is left open
+        # here and closed by the server itself (main() and reset_client())
+        self.access_token = None
+        self.token_expiry = 0
+        self._get_cache.clear()
+    
+    async def __aenter__(self) -> "EquinixClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    def _cached_token(self) -> Optional[str]:
+        """Return the cached access token if it is still valid"""
+        if self.access_token and time.monotonic() < self.token_expiry:
+            return self.access_token
+        return None
     
     async def get_access_token(self) -> str:
         """Get OAuth2 access token with caching"""
-        import time
-        
         # Return cached token if still valid
-        if self.access_token and time.time() < self.token_expiry:
-            return self.access_token
+        token = self._cached_token()
+        if token is not None:
+            return token
+        
+        # Serialize refreshes so concurrent callers share a single token request
+        async with self._token_lock:
+            # Another coroutine may have refreshed while we waited
+            token = self._cached_token()
+            if token is not None:
+                return token
             
-        response = await self.http_client.post(
-            OAUTH_URL,
-            json={
-                "grant_type": "client_credentials",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret
-            },
-            headers={"content-type": "application/json"}
-        )
-        response.raise_for_status()
-        data = response.json()
-        self.access_token = data["access_token"]
-        # Set expiry to 1 minute before actual expiration
-        self.token_expiry = time.time() + data.get("expires_in", 3600) - 60
-        return self.access_token
-    
-    async def make_request(self, method: str, endpoint: str, **kwargs) -> dict:
+            response = await self.http_client.post(
+                OAUTH_URL,
+                content=self._oauth_body,
+                headers=_JSON_CONTENT_TYPE
+            )
+            if not 200 <= response.status_code < 300:
+                response.raise_for_status()
+            data = _json_loads(response.content)
+            self.access_token = data["access_token"]
+            # Rebuild the auth headers only when the token changes; static
+            # headers are set once on the shared client
+            self._auth_headers = {"authorization": f"Bearer {self.access_token}"}
+            self._auth_json_headers = {**self._auth_headers, **_JSON_CONTENT_TYPE}
+            # Set expiry to 1 minute before actual expiration
+            self.token_expiry = time.monotonic() + data.get("expires_in", 3600) - 60
+            return self.access_token
+    
+    def _invalidate_token(self, response: httpx.Response) -> None:
+        """Drop the cached token if it is the one the API just rejected"""
+        rejected = response.request.headers.get("authorization")
+        if rejected == self._auth_headers.get("authorization"):
+            self.access_token = None
+            self.token_expiry = 0
+    
+    @staticmethod
+    def _request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+        """Hashable identity of a GET request, used for caching and coalescing"""
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+    
+    async def make_request(self, method: str, endpoint: str, **kwargs: Any) -> dict:
         """Make authenticated API request"""
-        token = await self.get_access_token()
-        headers = {
-            "authorization": f"Bearer {token}",
-            "content-type": "application/json"
-        }
+        if method != "GET":
+            return await self._send_request(method, endpoint, **kwargs)
         
-        url = f"{API_BASE_URL}{endpoint}"
-        response = await self.http_client.request(
-            method, url, headers=headers, **kwargs
-        )
-        response.raise_for_status()
-        return response.json()
+        # Concurrent identical GETs share a single in-flight request
+        key = self._request_key(endpoint, kwargs.get("params"))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, endpoint, **kwargs))
+            self._inflight[key] = task
+            
+            def _done(t: asyncio.Task) -> None:
+                self._inflight.pop(key, None)
+                # Mark the exception retrieved even if every waiter was cancelled
+                if not t.cancelled():
+                    t.exception()
+            
+            task.add_done_callback(_done)
+        # shield: one caller being cancelled must not cancel the others' request
+        return await asyncio.shield(task)
+    
+    async def _send_request(self, method: str, endpoint: str, **kwargs: Any) -> dict:
+        """Send a request with auth, concurrency bound and retries"""
+        has_body = "json" in kwargs
+        if has_body:
+            # Encode once up front so retries resend the same bytes
+            kwargs["content"] = _json_bytes(kwargs.pop("json"))
+        
+        if method.upper() in IDEMPOTENT_METHODS:
+            retry_statuses = IDEMPOTENT_RETRY_STATUS_CODES
+        else:
+            retry_statuses = RETRY_STATUS_CODES
+        
+        attempt = 0
+        token_refreshed = False
+        async with self._req_sem:
+            while True:
+                # Check the cache synchronously so the common case skips a coroutine
+                if self._cached_token() is None:
+                    await self.get_access_token()
+                
+                headers = self._auth_json_headers if has_body else self._auth_headers
+                response = await self.http_client.request(
+                    method, endpoint, headers=headers, **kwargs
+                )
+                if response.status_code == 401 and not token_refreshed:
+                    # The token can be revoked before it expires; refresh it and
+                    # resend once, outside the retry budget
+                    token_refreshed = True
+                    self._invalidate_token(response)
+                    continue
+                if response.status_code not in retry_statuses or attempt == MAX_RETRIES:
+                    break
+                await asyncio.sleep(_retry_delay(response, attempt))
+                attempt += 1
+        
+        # Only pay for raise_for_status() when the call actually failed
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        data: dict = _json_loads(response.content)
+        return data
+    
+    def _cache_lookup(self, key: tuple, ttl: float) -> Optional[dict]:
+        """Return a cached response younger than ttl seconds, if any"""
+        cached = self._get_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= ttl:
+            del self._get_cache[key]
+            return None
+        self._get_cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_store(self, key: tuple, value: dict) -> None:
+        """Cache a response, evicting least recently used entries past the cap"""
+        self._get_cache[key] = (time.monotonic(), value)
+        self._get_cache.move_to_end(key)
+        if len(self._get_cache) > GET_CACHE_MAX_ENTRIES:
+            self._get_cache.popitem(last=False)
+    
+    async def _cached_get(
+        self,
+        endpoint: str,
+        ttl: float,
+        params: Optional[Dict[str, Any]] = None
+    ) -> dict:
+        """GET with an in-process TTL cache"""
+        key = self._request_key(endpoint, params)
+        cached = self._cache_lookup(key, ttl)
+        if cached is not None:
+            return cached
+        
+        result = await self.make_request("GET", endpoint, params=params)
+        self._cache_store(key, result)
+        return result
     
     # ========== READ OPERATIONS (Existing) ==========
     
     async def list_ports(self, offset: int = 0, limit: int = 20) -> dict:
-        """List all Fabric ports"""
-        return await self.make_request(
-            "GET", 
-            f"/fabric/v4/ports?offset={offset}&limit={limit}"
+        """List all Fabric ports (cached briefly)"""
+        return await self._cached_get(
+            self._URL_PORTS,
+            PORT_CACHE_TTL,
+            params={"offset": offset, "limit": limit}
         )
     
     async def get_port(self, port_id: str) -> dict:
-        """Get details of a specific port"""
-        return await self.make_request("GET", f"/fabric/v4/ports/{port_id}")
+        """Get details of a specific port (cached briefly)"""
+        return await self._cached_get(f"{self._URL_PORTS}/{port_id}", PORT_CACHE_TTL)
     
     async def list_connections(self, offset: int = 0, limit: int = 20) -> dict:
         """List Fabric connections via search endpoint with pagination"""
@@ -89,7 +429,7 @@ class EquinixClient:
         }
         return await self.make_request(
             "POST",
-            "/fabric/v4/connections/search",
+            f"{self._URL_CONNECTIONS}/search",
             json=search_body
         )
     
@@ -97,7 +437,7 @@ class EquinixClient:
         """Get details of a specific connection"""
         return await self.make_request(
             "GET", 
-            f"/fabric/v4/connections/{connection_id}"
+            f"{self._URL_CONNECTIONS}/{connection_id}"
         )
     
     async def get_connection_stats(
@@ -128,12 +468,34 @@ class EquinixClient:
         }
         return await self.make_request(
             "POST",
-            "/fabric/v4/routers/search",
+            f"{self._URL_ROUTERS}/search",
             json=search_body
         )
     
     async def get_router(self, router_id: str) -> dict:
-        """Get Cloud Router details using search endpoint"""
+        """Get Cloud Router details (cached briefly), preferring a direct GET over search"""
+        url = f"{self._URL_ROUTERS}/{router_id}"
+        key = self._request_key(url, None)
+        cached = self._cache_lookup(key, ROUTER_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        router = await self._fetch_router(url, router_id)
+        self._cache_store(key, router)
+        return router
+    
+    async def _fetch_router(self, url: str, router_id: str) -> dict:
+        """Fetch a Cloud Router by direct GET, falling back to the search endpoint"""
+        if self._routers_direct_get:
+            try:
+                return await self.make_request("GET", url)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (404, 405):
+                    raise
+                if e.response.status_code == 405:
+                    # The API lacks the route; stop trying it for this client
+                    self._routers_direct_get = False
+        
         search_body = {
             "filter": {
                 "property": "/uuid",
@@ -144,12 +506,14 @@ class EquinixClient:
         }
         result = await self.make_request(
             "POST",
-            "/fabric/v4/routers/search",
+            f"{self._URL_ROUTERS}/search",
             json=search_body
         )
-        # Return the first (and only) result if found
+        # Return the first (and only) result if found. A 404 only falls back for
+        # this call: a freshly created router may not be served by GET yet
         if result.get("data") and len(result["data"]) > 0:
-            return result["data"][0]
+            router: dict = result["data"][0]
+            return router
         else:
             raise ValueError(f"Cloud Router with ID {router_id} not found")
     
@@ -157,7 +521,7 @@ class EquinixClient:
         """Search connections with filters"""
         return await self.make_request(
             "POST",
-            "/fabric/v4/connections/search",
+            f"{self._URL_CONNECTIONS}/search",
             json=query
         )
     
@@ -165,13 +529,28 @@ class EquinixClient:
         """Search Cloud Routers with filters"""
         return await self.make_request(
             "POST",
-            "/fabric/v4/routers/search",
+            f"{self._URL_ROUTERS}/search",
             json=query
         )
     
     async def list_metros(self) -> dict:
-        """List available metros"""
-        return await self.make_request("GET", "/fabric/v4/metros")
+        """List available metros (cached for METROS_CACHE_TTL seconds)"""
+        return await self._cached_get(self._URL_METROS, METROS_CACHE_TTL)
+    
+    async def batch_overview(self) -> dict:
+        """Fetch ports, connections, routers and metros concurrently"""
+        results = await asyncio.gather(
+            self.list_ports(),
+            self.list_connections(),
+            self.list_routers(),
+            self.list_metros(),
+            return_exceptions=True
+        )
+        # Report a failed section inline rather than losing the other three
+        return {
+            key: {"error": str(result)} if isinstance(result, Exception) else result
+            for key, result in zip(("ports", "connections", "routers", "metros"), results)
+        }
     
     # ========== WRITE OPERATIONS (Existing) ==========
     
@@ -180,45 +559,25 @@ class EquinixClient:
         payload = self._build_connection_payload(connection_data)
         return await self.make_request(
             "POST",
-            "/fabric/v4/connections",
+            self._URL_CONNECTIONS,
             json=payload
         )
     
     async def update_connection(self, connection_id: str, update_data: dict) -> dict:
         """Update an existing connection"""
-        payload = []
-        
-        if "name" in update_data:
-            payload.append({
+        payload = [
+            {
                 "op": "replace",
-                "path": "/name",
-                "value": update_data["name"]
-            })
-        
-        if "description" in update_data:
-            payload.append({
-                "op": "replace",
-                "path": "/description",
-                "value": update_data["description"]
-            })
-        
-        if "bandwidth" in update_data:
-            payload.append({
-                "op": "replace",
-                "path": "/bandwidth",
-                "value": update_data["bandwidth"]
-            })
-        
-        if "notifications" in update_data:
-            payload.append({
-                "op": "replace",
-                "path": "/notifications",
-                "value": [{"type": "ALL", "emails": update_data["notifications"]}]
-            })
+                "path": path,
+                "value": transform(update_data[key]) if transform else update_data[key]
+            }
+            for key, path, transform in self._PATCH_FIELDS
+            if key in update_data
+        ]
         
         return await self.make_request(
             "PATCH",
-            f"/fabric/v4/connections/{connection_id}",
+            f"{self._URL_CONNECTIONS}/{connection_id}",
             json=payload
         )
     
@@ -226,7 +585,7 @@ class EquinixClient:
         """Delete a connection"""
         return await self.make_request(
             "DELETE",
-            f"/fabric/v4/connections/{connection_id}"
+            f"{self._URL_CONNECTIONS}/{connection_id}"
         )
     
     async def validate_connection(self, connection_data: dict) -> dict:
@@ -234,7 +593,7 @@ class EquinixClient:
         payload = self._build_connection_payload(connection_data)
         return await self.make_request(
             "POST",
-            "/fabric/v4/connections/validate",
+            f"{self._URL_CONNECTIONS}/validate",
             json=payload
         )
     
@@ -271,26 +630,28 @@ class EquinixClient:
         service_type: Optional[str] = None,
         name: Optional[str] = None
     ) -> dict:
-        """List available service profiles"""
-        params = f"offset={offset}&limit={limit}"
+        """List available service profiles (cached briefly)"""
+        params: Dict[str, Any] = {"offset": offset, "limit": limit}
         
         if metro_code:
-            params += f"&filter[metroCode]={metro_code}"
+            params["filter[metroCode]"] = metro_code
         if service_type:
-            params += f"&filter[type]={service_type}"
+            params["filter[type]"] = service_type
         if name:
-            params += f"&filter[name]={name}"
+            params["filter[name]"] = name
         
-        return await self.make_request(
-            "GET",
-            f"/fabric/v4/serviceProfiles?{params}"
+        # Let httpx percent-encode filter values (e.g. names containing '&')
+        return await self._cached_get(
+            self._URL_SERVICE_PROFILES,
+            SERVICE_PROFILES_LIST_CACHE_TTL,
+            params=params
         )
     
     async def get_service_profile(self, profile_uuid: str) -> dict:
-        """Get details of a specific service profile"""
-        return await self.make_request(
-            "GET",
-            f"/fabric/v4/serviceProfiles/{profile_uuid}"
+        """Get details of a specific service profile (cached briefly)"""
+        return await self._cached_get(
+            f"{self._URL_SERVICE_PROFILES}/{profile_uuid}",
+            SERVICE_PROFILE_CACHE_TTL
         )
     
     # ========== SERVICE TOKENS ==========
@@ -327,7 +688,7 @@ class EquinixClient:
         
         return await self.make_request(
             "POST",
-            "/fabric/v4/serviceTokens",
+            self._URL_SERVICE_TOKENS,
             json=payload
         )
     
@@ -335,21 +696,22 @@ class EquinixClient:
         """List service tokens"""
         return await self.make_request(
             "GET",
-            f"/fabric/v4/serviceTokens?offset={offset}&limit={limit}"
+            self._URL_SERVICE_TOKENS,
+            params={"offset": offset, "limit": limit}
         )
     
     async def get_service_token(self, token_uuid: str) -> dict:
         """Get details of a specific service token"""
         return await self.make_request(
             "GET",
-            f"/fabric/v4/serviceTokens/{token_uuid}"
+            f"{self._URL_SERVICE_TOKENS}/{token_uuid}"
         )
     
     async def delete_service_token(self, token_uuid: str) -> dict:
         """Delete a service token"""
         return await self.make_request(
             "DELETE",
-            f"/fabric/v4/serviceTokens/{token_uuid}"
+            f"{self._URL_SERVICE_TOKENS}/{token_uuid}"
         )
     
     # ========== HELPER METHODS ==========
@@ -384,53 +746,74 @@ class EquinixClient:
         
         return payload
     
+    @staticmethod
+    def _ap_port(side: dict) -> dict:
+        """Access point for a Fabric port"""
+        return {
+            "type": "COLO",
+            "port": {"uuid": side["port_uuid"]},
+            "linkProtocol": (
+                {"type": "DOT1Q", "vlanTag": side["vlan"]}
+                if "vlan" in side
+                else {"type": "UNTAGGED"}
+            )
+        }
+    
+    @staticmethod
+    def _ap_vd(side: dict) -> dict:
+        """Access point for a virtual device"""
+        access_point = {
+            "type": "VD",
+            "virtualDevice": {"uuid": side["virtual_device_uuid"]}
+        }
+        if "vlan" in side:
+            access_point["interface"] = {"type": "NETWORK", "vlanTag": side["vlan"]}
+        return access_point
+    
+    @staticmethod
+    def _ap_stoken(side: dict) -> dict:
+        """Access point for a service token"""
+        return {
+            "type": "SERVICE_TOKEN",
+            "serviceToken": {"uuid": side["service_token_uuid"]}
+        }
+    
+    @staticmethod
+    def _ap_sp(side: dict) -> dict:
+        """Access point for a service profile"""
+        access_point = {
+            "type": "SP",
+            "profile": {"uuid": side["service_profile_uuid"], "type": "L2_PROFILE"}
+        }
+        if "seller_metro_code" in side:
+            access_point["location"] = {"metroCode": side["seller_metro_code"]}
+        return access_point
+    
+    # Endpoint type -> access point builder
+    _AP_BUILDERS = {
+        "port": _ap_port,
+        "virtual_device": _ap_vd,
+        "service_token": _ap_stoken,
+        "service_profile": _ap_sp,
+    }
+    
     def _build_access_point(self, side: dict) -> dict:
         """Build access point configuration"""
-        access_point = {}
-        
-        if side["type"] == "port":
-            access_point["type"] = "COLO"
-            access_point["port"] = {"uuid": side["port_uuid"]}
-            
-            if "vlan" in side:
-                access_point["linkProtocol"] = {
-                    "type": "DOT1Q",
-                    "vlanTag": side["vlan"]
-                }
-            else:
-                access_point["linkProtocol"] = {"type": "UNTAGGED"}
-        
-        elif side["type"] == "virtual_device":
-            access_point["type"] = "VD"
-            access_point["virtualDevice"] = {"uuid": side["virtual_device_uuid"]}
-            
-            if "vlan" in side:
-                access_point["interface"] = {
-                    "type": "NETWORK",
-                    "vlanTag": side["vlan"]
-                }
-        
-        elif side["type"] == "service_token":
-            access_point["type"] = "SERVICE_TOKEN"
-            access_point["serviceToken"] = {"uuid": side["service_token_uuid"]}
-        
-        elif side["type"] == "service_profile":
-            access_point["type"] = "SP"
-            access_point["profile"] = {
-                "uuid": side["service_profile_uuid"],
-                "type": "L2_PROFILE"
-            }
-            if "seller_metro_code" in side:
-                access_point["location"] = {"metroCode": side["seller_metro_code"]}
-        
-        return access_point
+        builder = self._AP_BUILDERS.get(side["type"])
+        if builder is None:
+            raise ValueError(f"Unsupported access point type: {side['type']}")
+        return builder(side)
 
 # Initialize the Equinix client
 equinix_client: Optional[EquinixClient] = None
+_client_lock = asyncio.Lock()
 
-def init_client():
+def init_client() -> EquinixClient:
     """Initialize the Equinix client from environment variables"""
     global equinix_client
+    if equinix_client is not None:
+        return equinix_client
+    
     client_id = os.getenv("EQUINIX_CLIENT_ID")
     client_secret = os.getenv("EQUINIX_CLIENT_SECRET")
     
@@ -440,689 +823,733 @@ def init_client():
         )
     
     equinix_client = EquinixClient(client_id, client_secret)
+    return equinix_client
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools"""
-    return [
-        # ========== READ OPERATIONS (Existing) ==========
-        Tool(
-            name="list_fabric_ports",
-            description="List all Equinix Fabric ports in your account",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "offset": {
-                        "type": "number",
-                        "description": "Pagination offset (default: 0)",
-                        "default": 0
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of results to return (default: 20, max: 100)",
-                        "default": 20
-                    }
+async def _get_equinix_client() -> EquinixClient:
+    """Return the shared Equinix client, creating it once on first use"""
+    if equinix_client is not None:
+        return equinix_client
+    async with _client_lock:
+        return init_client()
+
+async def reset_client() -> EquinixClient:
+    """Close the current client and build a new one, e.g. after rotating credentials"""
+    global equinix_client
+    async with _client_lock:
+        if equinix_client is not None:
+            await equinix_client.aclose()
+            equinix_client = None
+        await _close_http_client()
+        return init_client()
+
+# The tool catalog is static, so build it once at import time
+_TOOLS: list[Tool] = [
+    # ========== READ OPERATIONS (Existing) ==========
+    Tool(
+        name="list_fabric_ports",
+        description="List all Equinix Fabric ports in your account",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "offset": {
+                    "type": "number",
+                    "description": "Pagination offset (default: 0)",
+                    "default": 0
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Number of results to return (default: 20, max: 100)",
+                    "default": 20
                 }
             }
-        ),
-        Tool(
-            name="get_fabric_port",
-            description="Get detailed information about a specific Fabric port",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port_id": {
-                        "type": "string",
-                        "description": "UUID of the port"
-                    }
+        }
+    ),
+    Tool(
+        name="get_fabric_port",
+        description="Get detailed information about a specific Fabric port",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port_id": {
+                    "type": "string",
+                    "description": "UUID of the port"
+                }
+            },
+            "required": ["port_id"]
+        }
+    ),
+    Tool(
+        name="list_fabric_connections",
+        description="List all Fabric connections in your account",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "offset": {
+                    "type": "number",
+                    "description": "Pagination offset (default: 0)",
+                    "default": 0
                 },
-                "required": ["port_id"]
-            }
-        ),
-        Tool(
-            name="list_fabric_connections",
-            description="List all Fabric connections in your account",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "offset": {
-                        "type": "number",
-                        "description": "Pagination offset (default: 0)",
-                        "default": 0
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of results to return (default: 20, max: 100)",
-                        "default": 20
-                    }
+                "limit": {
+                    "type": "number",
+                    "description": "Number of results to return (default: 20, max: 100)",
+                    "default": 20
                 }
             }
-        ),
-        Tool(
-            name="get_fabric_connection",
-            description="Get detailed information about a specific Fabric connection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "connection_id": {
-                        "type": "string",
-                        "description": "UUID of the connection"
-                    }
+        }
+    ),
+    Tool(
+        name="get_fabric_connection",
+        description="Get detailed information about a specific Fabric connection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "connection_id": {
+                    "type": "string",
+                    "description": "UUID of the connection"
+                }
+            },
+            "required": ["connection_id"]
+        }
+    ),
+    Tool(
+        name="get_connection_stats",
+        description="Deprecated: Fabric v4 does not support connection stats endpoint",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="list_fabric_routers",
+        description="List all Fabric Cloud Routers in your account",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "offset": {
+                    "type": "number",
+                    "description": "Pagination offset (default: 0)",
+                    "default": 0
                 },
-                "required": ["connection_id"]
-            }
-        ),
-        Tool(
-            name="get_connection_stats",
-            description="Deprecated: Fabric v4 does not support connection stats endpoint",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="list_fabric_routers",
-            description="List all Fabric Cloud Routers in your account",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "offset": {
-                        "type": "number",
-                        "description": "Pagination offset (default: 0)",
-                        "default": 0
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of results to return (default: 20, max: 100)",
-                        "default": 20
-                    }
+                "limit": {
+                    "type": "number",
+                    "description": "Number of results to return (default: 20, max: 100)",
+                    "default": 20
                 }
             }
-        ),
-        Tool(
-            name="get_fabric_router",
-            description="Get detailed information about a specific Fabric Cloud Router",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "router_id": {
-                        "type": "string",
-                        "description": "UUID of the router"
-                    }
+        }
+    ),
+    Tool(
+        name="get_fabric_router",
+        description="Get detailed information about a specific Fabric Cloud Router",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "router_id": {
+                    "type": "string",
+                    "description": "UUID of the router"
+                }
+            },
+            "required": ["router_id"]
+        }
+    ),
+    Tool(
+        name="search_connections",
+        description="Search for connections using filters (name, state, bandwidth, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Filter by connection name (partial match)"
                 },
-                "required": ["router_id"]
-            }
-        ),
-        Tool(
-            name="search_connections",
-            description="Search for connections using filters (name, state, bandwidth, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Filter by connection name (partial match)"
-                    },
-                    "state": {
-                        "type": "string",
-                        "description": "Filter by state (e.g., ACTIVE, PENDING, DEPROVISIONED)",
-                        "enum": ["ACTIVE", "PENDING", "DEPROVISIONED", "PENDING_AUTO_APPROVAL"]
-                    },
-                    "offset": {
-                        "type": "number",
-                        "description": "Pagination offset (default: 0)",
-                        "default": 0
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of results (default: 20, max: 100)",
-                        "default": 20
-                    }
+                "state": {
+                    "type": "string",
+                    "description": "Filter by state (e.g., ACTIVE, PENDING, DEPROVISIONED)",
+                    "enum": ["ACTIVE", "PENDING", "DEPROVISIONED", "PENDING_AUTO_APPROVAL"]
+                },
+                "offset": {
+                    "type": "number",
+                    "description": "Pagination offset (default: 0)",
+                    "default": 0
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Number of results (default: 20, max: 100)",
+                    "default": 20
                 }
             }
-        ),
-        Tool(
-            name="list_metros",
-            description="List all available Equinix Fabric metro locations",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        
-        # ========== CONNECTION MANAGEMENT (Existing) ==========
-        Tool(
-            name="create_fabric_connection",
-            description="Creates a new Fabric virtual connection between two endpoints (ports, service profiles, or cloud providers). Returns the created connection with UUID and initial state.",
-            inputSchema={
-                "type": "object",
-                "required": ["name", "type", "bandwidth", "a_side", "z_side"],
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Connection name (required)"
-                    },
-                    "type": {
-                        "type": "string",
-                        "enum": ["EVPL_VC", "EPL_VC", "IPWAN_VC", "EPLAN_VC", "EVPLAN_VC"],
-                        "description": "Connection type: EVPL_VC (Ethernet Virtual Private Line), EPL_VC (Ethernet Private Line), IPWAN_VC (IP VPN), EPLAN_VC (Ethernet Private LAN), EVPLAN_VC (Ethernet Virtual Private LAN)"
-                    },
-                    "bandwidth": {
-                        "type": "number",
-                        "description": "Bandwidth in Mbps (e.g., 50, 100, 500, 1000, 2000, 5000, 10000)"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional connection description"
-                    },
-                    "notifications": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Email addresses for connection notifications"
-                    },
-                    "a_side": {
-                        "type": "object",
-                        "required": ["type"],
-                        "properties": {
-                            "type": {
-                                "type": "string",
-                                "enum": ["port", "virtual_device", "service_token"],
-                                "description": "A-side endpoint type"
-                            },
-                            "port_uuid": {
-                                "type": "string",
-                                "description": "Port UUID (required if type=port)"
-                            },
-                            "virtual_device_uuid": {
-                                "type": "string",
-                                "description": "Virtual device UUID (required if type=virtual_device)"
-                            },
-                            "service_token_uuid": {
-                                "type": "string",
-                                "description": "Service token UUID (required if type=service_token)"
-                            },
-                            "vlan": {
-                                "type": "number",
-                                "description": "VLAN tag (2-4094). Required for EVPL connections.",
-                                "minimum": 2,
-                                "maximum": 4094
-                            }
+        }
+    ),
+    Tool(
+        name="list_metros",
+        description="List all available Equinix Fabric metro locations",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="fabric_overview",
+        description="Get a combined overview of ports, connections, Cloud Routers, and metros in a single call (first page of each)",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    
+    # ========== CONNECTION MANAGEMENT (Existing) ==========
+    Tool(
+        name="create_fabric_connection",
+        description="Creates a new Fabric virtual connection between two endpoints (ports, service profiles, or cloud providers). Returns the created connection with UUID and initial state.",
+        inputSchema={
+            "type": "object",
+            "required": ["name", "type", "bandwidth", "a_side", "z_side"],
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Connection name (required)"
+                },
+                "type": {
+                    "type": "string",
+                    "enum": ["EVPL_VC", "EPL_VC", "IPWAN_VC", "EPLAN_VC", "EVPLAN_VC"],
+                    "description": "Connection type: EVPL_VC (Ethernet Virtual Private Line), EPL_VC (Ethernet Private Line), IPWAN_VC (IP VPN), EPLAN_VC (Ethernet Private LAN), EVPLAN_VC (Ethernet Virtual Private LAN)"
+                },
+                "bandwidth": {
+                    "type": "number",
+                    "description": "Bandwidth in Mbps (e.g., 50, 100, 500, 1000, 2000, 5000, 10000)"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Optional connection description"
+                },
+                "notifications": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Email addresses for connection notifications"
+                },
+                "a_side": {
+                    "type": "object",
+                    "required": ["type"],
+                    "properties": {
+                        "type": {
+                            "type": "string",
+                            "enum": ["port", "virtual_device", "service_token"],
+                            "description": "A-side endpoint type"
+                        },
+                        "port_uuid": {
+                            "type": "string",
+                            "description": "Port UUID (required if type=port)"
+                        },
+                        "virtual_device_uuid": {
+                            "type": "string",
+                            "description": "Virtual device UUID (required if type=virtual_device)"
+                        },
+                        "service_token_uuid": {
+                            "type": "string",
+                            "description": "Service token UUID (required if type=service_token)"
+                        },
+                        "vlan": {
+                            "type": "number",
+                            "description": "VLAN tag (2-4094). Required for EVPL connections.",
+                            "minimum": 2,
+                            "maximum": 4094
                         }
-                    },
-                    "z_side": {
-                        "type": "object",
-                        "required": ["type"],
-                        "properties": {
-                            "type": {
-                                "type": "string",
-                                "enum": ["port", "virtual_device", "service_token", "service_profile"],
-                                "description": "Z-side endpoint type"
-                            },
-                            "port_uuid": {
-                                "type": "string",
-                                "description": "Port UUID (required if type=port)"
-                            },
-                            "virtual_device_uuid": {
-                                "type": "string",
-                                "description": "Virtual device UUID (required if type=virtual_device)"
-                            },
-                            "service_token_uuid": {
-                                "type": "string",
-                                "description": "Service token UUID (required if type=service_token)"
-                            },
-                            "service_profile_uuid": {
-                                "type": "string",
-                                "description": "Service profile UUID (required if type=service_profile) - for connecting to cloud providers or partners"
-                            },
-                            "vlan": {
-                                "type": "number",
-                                "description": "VLAN tag (2-4094). Required for EVPL connections.",
-                                "minimum": 2,
-                                "maximum": 4094
-                            },
-                            "seller_metro_code": {
-                                "type": "string",
-                                "description": "Seller metro code (required for service_profile connections)"
-                            }
+                    }
+                },
+                "z_side": {
+                    "type": "object",
+                    "required": ["type"],
+                    "properties": {
+                        "type": {
+                            "type": "string",
+                            "enum": ["port", "virtual_device", "service_token", "service_profile"],
+                            "description": "Z-side endpoint type"
+                        },
+                        "port_uuid": {
+                            "type": "string",
+                            "description": "Port UUID (required if type=port)"
+                        },
+                        "virtual_device_uuid": {
+                            "type": "string",
+                            "description": "Virtual device UUID (required if type=virtual_device)"
+                        },
+                        "service_token_uuid": {
+                            "type": "string",
+                            "description": "Service token UUID (required if type=service_token)"
+                        },
+                        "service_profile_uuid": {
+                            "type": "string",
+                            "description": "Service profile UUID (required if type=service_profile) - for connecting to cloud providers or partners"
+                        },
+                        "vlan": {
+                            "type": "number",
+                            "description": "VLAN tag (2-4094). Required for EVPL connections.",
+                            "minimum": 2,
+                            "maximum": 4094
+                        },
+                        "seller_metro_code": {
+                            "type": "string",
+                            "description": "Seller metro code (required for service_profile connections)"
                         }
-                    },
-                    "redundancy": {
-                        "type": "object",
-                        "properties": {
-                            "priority": {
-                                "type": "string",
-                                "enum": ["PRIMARY", "SECONDARY"],
-                                "description": "Redundancy priority for this connection"
-                            },
-                            "group": {
-                                "type": "string",
-                                "description": "Redundancy group identifier"
-                            }
+                    }
+                },
+                "redundancy": {
+                    "type": "object",
+                    "properties": {
+                        "priority": {
+                            "type": "string",
+                            "enum": ["PRIMARY", "SECONDARY"],
+                            "description": "Redundancy priority for this connection"
+                        },
+                        "group": {
+                            "type": "string",
+                            "description": "Redundancy group identifier"
                         }
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID for the connection (enterprise feature)"
                     }
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project ID for the connection (enterprise feature)"
                 }
             }
-        ),
-        Tool(
-            name="update_connection",
-            description="Updates an existing connection. Supports modifying name, description, bandwidth, and notifications.",
-            inputSchema={
-                "type": "object",
-                "required": ["connection_uuid"],
-                "properties": {
-                    "connection_uuid": {
-                        "type": "string",
-                        "description": "UUID of the connection to update"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "New connection name"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New connection description"
-                    },
-                    "bandwidth": {
-                        "type": "number",
-                        "description": "New bandwidth in Mbps (may incur charges)"
-                    },
-                    "notifications": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Updated email addresses for notifications"
-                    }
+        }
+    ),
+    Tool(
+        name="update_connection",
+        description="Updates an existing connection. Supports modifying name, description, bandwidth, and notifications.",
+        inputSchema={
+            "type": "object",
+            "required": ["connection_uuid"],
+            "properties": {
+                "connection_uuid": {
+                    "type": "string",
+                    "description": "UUID of the connection to update"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "New connection name"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New connection description"
+                },
+                "bandwidth": {
+                    "type": "number",
+                    "description": "New bandwidth in Mbps (may incur charges)"
+                },
+                "notifications": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Updated email addresses for notifications"
                 }
             }
-        ),
-        Tool(
-            name="delete_connection",
-            description="Deletes a Fabric connection. This action cannot be undone and will terminate the connection.",
-            inputSchema={
-                "type": "object",
-                "required": ["connection_uuid"],
-                "properties": {
-                    "connection_uuid": {
-                        "type": "string",
-                        "description": "UUID of the connection to delete"
-                    }
+        }
+    ),
+    Tool(
+        name="delete_connection",
+        description="Deletes a Fabric connection. This action cannot be undone and will terminate the connection.",
+        inputSchema={
+            "type": "object",
+            "required": ["connection_uuid"],
+            "properties": {
+                "connection_uuid": {
+                    "type": "string",
+                    "description": "UUID of the connection to delete"
                 }
             }
-        ),
-        Tool(
-            name="validate_connection_config",
-            description="Validates a connection configuration before creation to check for errors, conflicts, or incompatibilities. Does not create the connection.",
-            inputSchema={
-                "type": "object",
-                "required": ["connection_config"],
-                "properties": {
-                    "connection_config": {
-                        "type": "object",
-                        "description": "Connection configuration to validate (same structure as create_fabric_connection parameters)"
-                    }
+        }
+    ),
+    Tool(
+        name="validate_connection_config",
+        description="Validates a connection configuration before creation to check for errors, conflicts, or incompatibilities. Does not create the connection.",
+        inputSchema={
+            "type": "object",
+            "required": ["connection_config"],
+            "properties": {
+                "connection_config": {
+                    "type": "object",
+                    "description": "Connection configuration to validate (same structure as create_fabric_connection parameters)"
                 }
             }
-        ),
-        
-        # ========== CLOUD ROUTER MANAGEMENT (New) ==========
-        Tool(
-            name="create_fabric_router",
-            description="Create a new Fabric Cloud Router in a specified metro location. Cloud Routers enable dynamic Layer 3 routing between multiple connections using BGP.",
-            inputSchema={
-                "type": "object",
-                "required": ["name", "metro_code", "package"],
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Router name (e.g., 'FCR-SG0-MCP-CHULIU')"
-                    },
-                    "metro_code": {
-                        "type": "string",
-                        "description": "Metro code where router will be deployed (e.g., 'SG', 'NY', 'LD', 'SV', 'HK')"
-                    },
-                    "package": {
-                        "type": "string",
-                        "enum": ["STANDARD", "PRO", "ADVANCED"],
-                        "description": "Router package type: STANDARD (basic routing, up to 10 connections), PRO (enhanced routing, more connections), ADVANCED (full BGP features, high capacity)"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional router description"
-                    },
-                    "project_id": {
-                        "type": "string",
-                        "description": "Project ID to associate the router with (enterprise feature)"
-                    },
-                    "notifications": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Email addresses for router notifications"
+        }
+    ),
+    
+    # ========== CLOUD ROUTER MANAGEMENT (New) ==========
+    Tool(
+        name="create_fabric_router",
+        description="Create a new Fabric Cloud Router in a specified metro location. Cloud Routers enable dynamic Layer 3 routing between multiple connections using BGP.",
+        inputSchema={
+            "type": "object",
+            "required": ["name", "metro_code", "package"],
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Router name (e.g., 'FCR-SG0-MCP-CHULIU')"
+                },
+                "metro_code": {
+                    "type": "string",
+                    "description": "Metro code where router will be deployed (e.g., 'SG', 'NY', 'LD', 'SV', 'HK')"
+                },
+                "package": {
+                    "type": "string",
+                    "enum": ["STANDARD", "PRO", "ADVANCED"],
+                    "description": "Router package type: STANDARD (basic routing, up to 10 connections), PRO (enhanced routing, more connections), ADVANCED (full BGP features, high capacity)"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Optional router description"
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project ID to associate the router with (enterprise feature)"
+                },
+                "notifications": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Email addresses for router notifications"
+                },
+                "order": {
+                    "type": "object",
+                    "properties": {
+                        "purchaseOrderNumber": {
+                            "type": "string",
+                            "description": "Purchase order number for billing"
+                        }
                     },
-                    "order": {
-                        "type": "object",
-                        "properties": {
-                            "purchaseOrderNumber": {
-                                "type": "string",
-                                "description": "Purchase order number for billing"
-                            }
-                        },
-                        "description": "Optional order information"
-                    }
+                    "description": "Optional order information"
                 }
             }
-        ),
-        Tool(
-            name="update_fabric_router",
-            description="Update an existing Fabric Cloud Router. Supports modifying name, description, package, and notifications.",
-            inputSchema={
-                "type": "object",
-                "required": ["router_uuid"],
-                "properties": {
-                    "router_uuid": {
-                        "type": "string",
-                        "description": "UUID of the router to update"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "New router name"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New router description"
-                    },
-                    "package": {
-                        "type": "string",
-                        "enum": ["STANDARD", "PRO", "ADVANCED"],
-                        "description": "New router package (may incur charges)"
-                    },
-                    "notifications": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Updated email addresses for notifications"
-                    }
+        }
+    ),
+    Tool(
+        name="update_fabric_router",
+        description="Update an existing Fabric Cloud Router. Supports modifying name, description, package, and notifications.",
+        inputSchema={
+            "type": "object",
+            "required": ["router_uuid"],
+            "properties": {
+                "router_uuid": {
+                    "type": "string",
+                    "description": "UUID of the router to update"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "New router name"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New router description"
+                },
+                "package": {
+                    "type": "string",
+                    "enum": ["STANDARD", "PRO", "ADVANCED"],
+                    "description": "New router package (may incur charges)"
+                },
+                "notifications": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Updated email addresses for notifications"
                 }
             }
-        ),
-        Tool(
-            name="delete_fabric_router",
-            description="Delete a Fabric Cloud Router. This action cannot be undone. All connections using this router must be deleted first.",
-            inputSchema={
-                "type": "object",
-                "required": ["router_uuid"],
-                "properties": {
-                    "router_uuid": {
-                        "type": "string",
-                        "description": "UUID of the router to delete"
-                    }
+        }
+    ),
+    Tool(
+        name="delete_fabric_router",
+        description="Delete a Fabric Cloud Router. This action cannot be undone. All connections using this router must be deleted first.",
+        inputSchema={
+            "type": "object",
+            "required": ["router_uuid"],
+            "properties": {
+                "router_uuid": {
+                    "type": "string",
+                    "description": "UUID of the router to delete"
                 }
             }
-        ),
-        
-        # ========== SERVICE PROFILES (Existing) ==========
-        Tool(
-            name="list_service_profiles",
-            description="Lists available service profiles that can be used as connection destinations. Service profiles represent cloud providers (AWS, Azure, GCP, Oracle, IBM) and network service providers.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "metro_code": {
-                        "type": "string",
-                        "description": "Filter by metro code (e.g., 'SV', 'NY', 'LD')"
-                    },
-                    "service_type": {
-                        "type": "string",
-                        "enum": ["CLOUD_ROUTER", "EVPL", "EPL", "IPWAN"],
-                        "description": "Filter by service type"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Filter by service profile name (partial match)"
-                    },
-                    "limit": {
-                        "type": "number",
-                        "default": 20,
-                        "description": "Number of results to return (default: 20, max: 100)"
-                    },
-                    "offset": {
-                        "type": "number",
-                        "default": 0,
-                        "description": "Pagination offset (default: 0)"
-                    }
+        }
+    ),
+    
+    # ========== SERVICE PROFILES (Existing) ==========
+    Tool(
+        name="list_service_profiles",
+        description="Lists available service profiles that can be used as connection destinations. Service profiles represent cloud providers (AWS, Azure, GCP, Oracle, IBM) and network service providers.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "metro_code": {
+                    "type": "string",
+                    "description": "Filter by metro code (e.g., 'SV', 'NY', 'LD')"
+                },
+                "service_type": {
+                    "type": "string",
+                    "enum": ["CLOUD_ROUTER", "EVPL", "EPL", "IPWAN"],
+                    "description": "Filter by service type"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Filter by service profile name (partial match)"
+                },
+                "limit": {
+                    "type": "number",
+                    "default": 20,
+                    "description": "Number of results to return (default: 20, max: 100)"
+                },
+                "offset": {
+                    "type": "number",
+                    "default": 0,
+                    "description": "Pagination offset (default: 0)"
                 }
             }
-        ),
-        Tool(
-            name="get_service_profile",
-            description="Gets detailed information about a specific service profile, including available metros, bandwidth options, and configuration requirements.",
-            inputSchema={
-                "type": "object",
-                "required": ["profile_uuid"],
-                "properties": {
-                    "profile_uuid": {
-                        "type": "string",
-                        "description": "UUID of the service profile"
-                    }
+        }
+    ),
+    Tool(
+        name="get_service_profile",
+        description="Gets detailed information about a specific service profile, including available metros, bandwidth options, and configuration requirements.",
+        inputSchema={
+            "type": "object",
+            "required": ["profile_uuid"],
+            "properties": {
+                "profile_uuid": {
+                    "type": "string",
+                    "description": "UUID of the service profile"
                 }
             }
-        ),
-        
-        # ========== SERVICE TOKENS (Existing) ==========
-        Tool(
-            name="create_service_token",
-            description="Creates a service token that can be shared with another party to allow them to create a connection to your port or virtual device. Useful for enabling partner connections without sharing credentials.",
-            inputSchema={
-                "type": "object",
-                "required": ["name", "type", "expiration_date"],
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Service token name"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Service token description"
-                    },
-                    "type": {
-                        "type": "string",
-                        "enum": ["VC_TOKEN"],
-                        "description": "Token type (currently only VC_TOKEN is supported)"
-                    },
-                    "expiration_date": {
-                        "type": "string",
-                        "format": "date-time",
-                        "description": "Token expiration date (ISO 8601 format, e.g., '2025-12-31T23:59:59Z')"
-                    },
-                    "service_token_connection": {
-                        "type": "object",
-                        "required": ["type"],
-                        "properties": {
-                            "type": {
-                                "type": "string",
-                                "enum": ["EVPL_VC"],
-                                "description": "Connection type for the token"
-                            },
-                            "supported_bandwidths": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "description": "Allowed bandwidth values in Mbps (e.g., [50, 100, 500, 1000])"
-                            },
-                            "a_side": {
-                                "type": "object",
-                                "properties": {
-                                    "port_uuid": {
-                                        "type": "string",
-                                        "description": "Port UUID to share"
-                                    },
-                                    "virtual_device_uuid": {
-                                        "type": "string",
-                                        "description": "Virtual device UUID to share"
-                                    },
-                                    "vlan": {
-                                        "type": "number",
-                                        "description": "VLAN tag (optional)"
-                                    }
+        }
+    ),
+    
+    # ========== SERVICE TOKENS (Existing) ==========
+    Tool(
+        name="create_service_token",
+        description="Creates a service token that can be shared with another party to allow them to create a connection to your port or virtual device. Useful for enabling partner connections without sharing credentials.",
+        inputSchema={
+            "type": "object",
+            "required": ["name", "type", "expiration_date"],
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Service token name"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Service token description"
+                },
+                "type": {
+                    "type": "string",
+                    "enum": ["VC_TOKEN"],
+                    "description": "Token type (currently only VC_TOKEN is supported)"
+                },
+                "expiration_date": {
+                    "type": "string",
+                    "format": "date-time",
+                    "description": "Token expiration date (ISO 8601 format, e.g., '2025-12-31T23:59:59Z')"
+                },
+                "service_token_connection": {
+                    "type": "object",
+                    "required": ["type"],
+                    "properties": {
+                        "type": {
+                            "type": "string",
+                            "enum": ["EVPL_VC"],
+                            "description": "Connection type for the token"
+                        },
+                        "supported_bandwidths": {
+                            "type": "array",
+                            "items": {"type": "number"},
+                            "description": "Allowed bandwidth values in Mbps (e.g., [50, 100, 500, 1000])"
+                        },
+                        "a_side": {
+                            "type": "object",
+                            "properties": {
+                                "port_uuid": {
+                                    "type": "string",
+                                    "description": "Port UUID to share"
+                                },
+                                "virtual_device_uuid": {
+                                    "type": "string",
+                                    "description": "Virtual device UUID to share"
+                                },
+                                "vlan": {
+                                    "type": "number",
+                                    "description": "VLAN tag (optional)"
                                 }
                             }
                         }
-                    },
-                    "notifications": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Email addresses for token notifications"
                     }
+                },
+                "notifications": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Email addresses for token notifications"
                 }
             }
-        ),
-        Tool(
-            name="list_service_tokens",
-            description="List all service tokens in your account",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "offset": {
-                        "type": "number",
-                        "description": "Pagination offset (default: 0)",
-                        "default": 0
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Number of results to return (default: 20, max: 100)",
-                        "default": 20
-                    }
+        }
+    ),
+    Tool(
+        name="list_service_tokens",
+        description="List all service tokens in your account",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "offset": {
+                    "type": "number",
+                    "description": "Pagination offset (default: 0)",
+                    "default": 0
+                },
+                "limit": {
+                    "type": "number",
+                    "description": "Number of results to return (default: 20, max: 100)",
+                    "default": 20
                 }
             }
-        ),
-        Tool(
-            name="get_service_token",
-            description="Get details of a specific service token",
-            inputSchema={
-                "type": "object",
-                "required": ["token_uuid"],
-                "properties": {
-                    "token_uuid": {
-                        "type": "string",
-                        "description": "UUID of the service token"
-                    }
+        }
+    ),
+    Tool(
+        name="get_service_token",
+        description="Get details of a specific service token",
+        inputSchema={
+            "type": "object",
+            "required": ["token_uuid"],
+            "properties": {
+                "token_uuid": {
+                    "type": "string",
+                    "description": "UUID of the service token"
                 }
             }
-        ),
-        Tool(
-            name="delete_service_token",
-            description="Delete a service token",
-            inputSchema={
-                "type": "object",
-                "required": ["token_uuid"],
-                "properties": {
-                    "token_uuid": {
-                        "type": "string",
-                        "description": "UUID of the service token to delete"
-                    }
+        }
+    ),
+    Tool(
+        name="delete_service_token",
+        description="Delete a service token",
+        inputSchema={
+            "type": "object",
+            "required": ["token_uuid"],
+            "properties": {
+                "token_uuid": {
+                    "type": "string",
+                    "description": "UUID of the service token to delete"
                 }
             }
-        )
-    ]
+        }
+    )
+]
 
-@app.call_tool()
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools"""
+    return _TOOLS
+
+# Argument validators compiled once per tool. The SDK's own input validation
+# re-checks the schema on every call, so it is switched off where supported.
+_VALIDATORS: Dict[str, Any] = {}
+if jsonschema is not None:
+    _VALIDATORS = {
+        tool.name: jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+        for tool in _TOOLS
+    }
+
+if "validate_input" in inspect.signature(app.call_tool).parameters:
+    _register_call_tool = app.call_tool(validate_input=False)
+else:
+    _register_call_tool = app.call_tool()
+
+def _page(arguments: Any) -> Dict[str, Any]:
+    """Pagination arguments with the schema defaults applied"""
+    return {"offset": arguments.get("offset", 0), "limit": arguments.get("limit", 20)}
+
+async def _search_connections(client: EquinixClient, arguments: Any) -> dict:
+    # Build search query from whichever keys the caller supplied
+    filter_query = {
+        "filter": {k: arguments[k] for k in ("name", "state") if k in arguments},
+        "pagination": {k: arguments[k] for k in ("offset", "limit") if k in arguments}
+    }
+    return await client.search_connections(filter_query)
+
+async def _update_connection(client: EquinixClient, arguments: Any) -> dict:
+    # Split off the UUID without mutating the caller's arguments
+    update_data = {k: v for k, v in arguments.items() if k != "connection_uuid"}
+    return await client.update_connection(arguments["connection_uuid"], update_data)
+
+_ROUTER_UNSUPPORTED = (
+    "Cloud Routers are not available in Fabric v4 API. "
+    "Use Fabric connections and service profiles instead."
+)
+
+# Tools the Fabric v4 API cannot serve; answered without touching the client
+UNSUPPORTED_TOOLS: Dict[str, str] = {
+    "get_connection_stats": (
+        "get_connection_stats is not supported: Fabric v4 does not provide "
+        "/connections/{uuid}/stats. Use get_fabric_connection or search endpoints."
+    ),
+    "create_fabric_router": _ROUTER_UNSUPPORTED,
+    "update_fabric_router": _ROUTER_UNSUPPORTED,
+    "delete_fabric_router": _ROUTER_UNSUPPORTED,
+}
+
+# Their responses never change, so build them once
+_UNSUPPORTED_RESPONSES: Dict[str, list[TextContent]] = {
+    name: [TextContent(type="text", text=f"Error calling {name}: {message}")]
+    for name, message in UNSUPPORTED_TOOLS.items()
+}
+
+# Tool name -> handler(client, arguments), looked up once per call
+TOOL_HANDLERS: Dict[str, Callable[[EquinixClient, Any], Awaitable[Any]]] = {
+    # ========== READ OPERATIONS (Existing) ==========
+    "list_fabric_ports": lambda c, a: c.list_ports(**_page(a)),
+    "get_fabric_port": lambda c, a: c.get_port(a["port_id"]),
+    "list_fabric_connections": lambda c, a: c.list_connections(**_page(a)),
+    "get_fabric_connection": lambda c, a: c.get_connection(a["connection_id"]),
+    "list_fabric_routers": lambda c, a: c.list_routers(**_page(a)),
+    "get_fabric_router": lambda c, a: c.get_router(a["router_id"]),
+    "search_connections": _search_connections,
+    "list_metros": lambda c, a: c.list_metros(),
+    "fabric_overview": lambda c, a: c.batch_overview(),
+    
+    # ========== CONNECTION MANAGEMENT (Existing) ==========
+    "create_fabric_connection": lambda c, a: c.create_connection(a),
+    "update_connection": _update_connection,
+    "delete_connection": lambda c, a: c.delete_connection(a["connection_uuid"]),
+    "validate_connection_config": lambda c, a: c.validate_connection(a["connection_config"]),
+    
+    # ========== SERVICE PROFILES (Existing) ==========
+    "list_service_profiles": lambda c, a: c.list_service_profiles(
+        **_page(a),
+        metro_code=a.get("metro_code"),
+        service_type=a.get("service_type"),
+        name=a.get("name")
+    ),
+    "get_service_profile": lambda c, a: c.get_service_profile(a["profile_uuid"]),
+    
+    # ========== SERVICE TOKENS (Existing) ==========
+    "create_service_token": lambda c, a: c.create_service_token(a),
+    "list_service_tokens": lambda c, a: c.list_service_tokens(**_page(a)),
+    "get_service_token": lambda c, a: c.get_service_token(a["token_uuid"]),
+    "delete_service_token": lambda c, a: c.delete_service_token(a["token_uuid"]),
+}
+
+@_register_call_tool
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls"""
-    if equinix_client is None:
-        init_client()
+    unsupported = _UNSUPPORTED_RESPONSES.get(name)
+    if unsupported is not None:
+        return unsupported
+    
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        # Report the error the SDK's jsonschema.validate() would have picked;
+        # raising lets the SDK return it as an isError result
+        error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+        if error is not None:
+            raise ValueError(f"Input validation error: {error.message}")
+    
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    
+    # main() builds the client at startup, so this is normally a plain global read
+    client = equinix_client or await _get_equinix_client()
     
     try:
-        # ========== READ OPERATIONS (Existing) ==========
-        if name == "list_fabric_ports":
-            result = await equinix_client.list_ports(
-                offset=arguments.get("offset", 0),
-                limit=arguments.get("limit", 20)
-            )
-        elif name == "get_fabric_port":
-            result = await equinix_client.get_port(arguments["port_id"])
-        elif name == "list_fabric_connections":
-            result = await equinix_client.list_connections(
-                offset=arguments.get("offset", 0),
-                limit=arguments.get("limit", 20)
-            )
-        elif name == "get_fabric_connection":
-            result = await equinix_client.get_connection(arguments["connection_id"])
-        elif name == "get_connection_stats":
-            # Surface clear message since endpoint is not supported in Fabric v4
-            raise NotImplementedError(
-                "get_connection_stats is not supported: Fabric v4 does not provide "
-                "/connections/{uuid}/stats. Use get_fabric_connection or search endpoints."
-            )
-        elif name == "list_fabric_routers":
-            result = await equinix_client.list_routers(
-                offset=arguments.get("offset", 0),
-                limit=arguments.get("limit", 20)
-            )
-        elif name == "get_fabric_router":
-            result = await equinix_client.get_router(arguments["router_id"])
-        elif name == "search_connections":
-            # Build search query
-            filter_query = {"filter": {}, "pagination": {}}
-            if "name" in arguments:
-                filter_query["filter"]["name"] = arguments["name"]
-            if "state" in arguments:
-                filter_query["filter"]["state"] = arguments["state"]
-            if "offset" in arguments:
-                filter_query["pagination"]["offset"] = arguments.get("offset", 0)
-            if "limit" in arguments:
-                filter_query["pagination"]["limit"] = arguments.get("limit", 20)
-            result = await equinix_client.search_connections(filter_query)
-        elif name == "list_metros":
-            result = await equinix_client.list_metros()
-        
-        # ========== CONNECTION MANAGEMENT (Existing) ==========
-        elif name == "create_fabric_connection":
-            result = await equinix_client.create_connection(arguments)
-        elif name == "update_connection":
-            connection_uuid = arguments.pop("connection_uuid")
-            result = await equinix_client.update_connection(connection_uuid, arguments)
-        elif name == "delete_connection":
-            result = await equinix_client.delete_connection(arguments["connection_uuid"])
-        elif name == "validate_connection_config":
-            result = await equinix_client.validate_connection(arguments["connection_config"])
-        
-        # ========== CLOUD ROUTER MANAGEMENT (New) ==========
-        elif name == "create_fabric_router":
-            result = await equinix_client.create_router(arguments)
-        elif name == "update_fabric_router":
-            router_uuid = arguments.pop("router_uuid")
-            result = await equinix_client.update_router(router_uuid, arguments)
-        elif name == "delete_fabric_router":
-            result = await equinix_client.delete_router(arguments["router_uuid"])
-        
-        # ========== SERVICE PROFILES (Existing) ==========
-        elif name == "list_service_profiles":
-            result = await equinix_client.list_service_profiles(
-                offset=arguments.get("offset", 0),
-                limit=arguments.get("limit", 20),
-                metro_code=arguments.get("metro_code"),
-                service_type=arguments.get("service_type"),
-                name=arguments.get("name")
-            )
-        elif name == "get_service_profile":
-            result = await equinix_client.get_service_profile(arguments["profile_uuid"])
-        
-        # ========== SERVICE TOKENS (Existing) ==========
-        elif name == "create_service_token":
-            result = await equinix_client.create_service_token(arguments)
-        elif name == "list_service_tokens":
-            result = await equinix_client.list_service_tokens(
-                offset=arguments.get("offset", 0),
-                limit=arguments.get("limit", 20)
-            )
-        elif name == "get_service_token":
-            result = await equinix_client.get_service_token(arguments["token_uuid"])
-        elif name == "delete_service_token":
-            result = await equinix_client.delete_service_token(arguments["token_uuid"])
-        
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        result = await handler(client, arguments)
         
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=_json_dumps(result)
         )]
     
     except httpx.HTTPStatusError as e:
@@ -1134,16 +1561,57 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             text=f"Error calling {name}: {str(e)}"
         )]
 
-async def main():
+async def _warm_up(client: EquinixClient) -> None:
+    """Fetch a token ahead of the first tool call to prime the pooled connection"""
+    try:
+        await client.get_access_token()
+    except Exception:
+        # Credential or network problems surface on the first real tool call
+        pass
+
+async def main() -> None:
     """Run the MCP server"""
-    from mcp.server.stdio import stdio_server
+    logger.info(
+        "HTTP settings: max_connections=%s max_keepalive=%s timeout=%ss http2=%s "
+        "max_concurrent_requests=%s",
+        HTTP_LIMITS.max_connections,
+        HTTP_LIMITS.max_keepalive_connections,
+        HTTP_TIMEOUT,
+        HTTP2_ENABLED,
+        MAX_CONCURRENT_REQUESTS
+    )
     
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    warm_up: Optional[asyncio.Task] = None
+    try:
+        warm_up = asyncio.create_task(_warm_up(init_client()))
+    except ValueError:
+        # Missing credentials are reported when a tool is called
+        pass
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        if warm_up is not None and not warm_up.done():
+            warm_up.cancel()
+        if equinix_client is not None:
+            await equinix_client.aclose()
+        await _close_http_client()
+
+def run() -> None:
+    """Console entry point; runs the server on uvloop when it is installed"""
+    # stdout carries the MCP protocol, so log to stderr (basicConfig's default).
+    # Only this module logs at INFO; a host's own logging setup takes precedence.
+    logging.basicConfig(format="%(asctime)s %(name)s %(levelname)s: %(message)s")
+    logger.setLevel(logging.INFO)
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
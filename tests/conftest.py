@@ -0,0 +1,52 @@
+"""Shared fixtures: an EquinixClient wired to an in-memory Fabric API"""
+
+import asyncio
+from typing import Any, Callable, List, Optional
+
+import httpx
+import pytest
+
+import server
+
+
+class FakeAPI:
+    """Answers the OAuth endpoint itself and API calls with a test-supplied handler"""
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+        self.token_requests = 0
+        self.handler: Optional[Callable[[httpx.Request], Any]] = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth2/v1/token":
+            self.token_requests += 1
+            return httpx.Response(
+                200,
+                json={"access_token": f"token-{self.token_requests}", "expires_in": 3600}
+            )
+        self.requests.append(request)
+        if self.handler is None:
+            return httpx.Response(200, json={})
+        response = self.handler(request)
+        if asyncio.iscoroutine(response):
+            response = await response
+        return response
+
+
+@pytest.fixture
+async def api(monkeypatch: pytest.MonkeyPatch):
+    fake = FakeAPI()
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    # The shared client is reused as long as it was created on the running loop
+    monkeypatch.setattr(server, "_http_client", http_client)
+    monkeypatch.setattr(server, "_http_client_loop", asyncio.get_running_loop())
+    # No real sleeping between retries
+    monkeypatch.setattr(server, "RETRY_BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(server, "RETRY_JITTER", 0.0)
+    yield fake
+    await http_client.aclose()
+
+
+@pytest.fixture
+def client(api: FakeAPI) -> server.EquinixClient:
+    return server.EquinixClient("client-id", "client-secret")
@@ -0,0 +1,47 @@
+"""In-process LRU/TTL cache for slow-changing GET endpoints"""
+
+import server
+
+URL = server.EquinixClient._URL_METROS
+
+
+async def test_cached_get_reuses_fresh_entry(api, client):
+    await client._cached_get(URL, ttl=60.0)
+    await client._cached_get(URL, ttl=60.0)
+    assert len(api.requests) == 1
+
+
+async def test_cached_get_refetches_expired_entry(api, client):
+    await client._cached_get(URL, ttl=60.0)
+    # Age the entry past its TTL
+    key = client._request_key(URL, None)
+    stored_at, value = client._get_cache[key]
+    client._get_cache[key] = (stored_at - 61.0, value)
+
+    await client._cached_get(URL, ttl=60.0)
+    assert len(api.requests) == 2
+
+
+def test_cache_evicts_least_recently_used(monkeypatch, client):
+    monkeypatch.setattr(server, "GET_CACHE_MAX_ENTRIES", 2)
+    client._cache_store(("a",), {"n": 1})
+    client._cache_store(("b",), {"n": 2})
+    # Touch "a" so "b" becomes the least recently used entry
+    assert client._cache_lookup(("a",), ttl=60.0) == {"n": 1}
+    client._cache_store(("c",), {"n": 3})
+
+    assert client._cache_lookup(("b",), ttl=60.0) is None
+    assert client._cache_lookup(("a",), ttl=60.0) == {"n": 1}
+    assert client._cache_lookup(("c",), ttl=60.0) == {"n": 3}
+
+
+async def test_list_metros_is_served_from_cache(api, client):
+    assert await client.list_metros() == await client.list_metros()
+    assert len(api.requests) == 1
+
+
+async def test_port_listings_are_cached_per_page(api, client):
+    await client.list_ports(offset=0, limit=20)
+    await client.list_ports(offset=0, limit=20)
+    await client.list_ports(offset=20, limit=20)
+    assert len(api.requests) == 2
@@ -0,0 +1,55 @@
+"""Coalescing of concurrent identical GET requests in EquinixClient"""
+
+import asyncio
+
+import httpx
+
+import server
+
+URL = server.EquinixClient._URL_METROS
+
+
+async def test_concurrent_identical_gets_share_one_request(api, client):
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(200, json={"data": ["SV"]})
+
+    api.handler = handler
+    calls = [asyncio.ensure_future(client.make_request("GET", URL)) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    assert len(api.requests) == 1
+    assert results == [{"data": ["SV"]}] * 10
+    assert client._inflight == {}
+
+
+async def test_different_params_are_not_coalesced(api, client):
+    await asyncio.gather(
+        client.make_request("GET", URL, params={"offset": 0}),
+        client.make_request("GET", URL, params={"offset": 20}),
+    )
+    assert len(api.requests) == 2
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_request(api, client):
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    api.handler = handler
+    first = asyncio.ensure_future(client.make_request("GET", URL))
+    second = asyncio.ensure_future(client.make_request("GET", URL))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == {"ok": True}
+    assert first.cancelled()
+    assert len(api.requests) == 1
@@ -0,0 +1,99 @@
+"""Environment variable parsing for the server tuning knobs"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import server
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_server(**env):
+    """Import server in a fresh interpreter with extra environment variables"""
+    return subprocess.run(
+        [sys.executable, "-c", "import server"],
+        cwd=REPO_ROOT,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.mark.parametrize("value", ["1", "true", "YES"])
+def test_env_flag_true_values(monkeypatch, value):
+    monkeypatch.setenv("EQUINIX_TEST_FLAG", value)
+    assert server._env_flag("EQUINIX_TEST_FLAG", False) is True
+
+
+@pytest.mark.parametrize("value", ["0", "false", "No"])
+def test_env_flag_false_values(monkeypatch, value):
+    monkeypatch.setenv("EQUINIX_TEST_FLAG", value)
+    assert server._env_flag("EQUINIX_TEST_FLAG", True) is False
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_env_flag_unset_uses_default(monkeypatch, value):
+    monkeypatch.delenv("EQUINIX_TEST_FLAG", raising=False)
+    if value is not None:
+        monkeypatch.setenv("EQUINIX_TEST_FLAG", value)
+    assert server._env_flag("EQUINIX_TEST_FLAG", True) is True
+
+
+def test_env_flag_rejects_unknown_values(monkeypatch):
+    monkeypatch.setenv("EQUINIX_TEST_FLAG", "on")
+    with pytest.raises(ValueError, match="EQUINIX_TEST_FLAG"):
+        server._env_flag("EQUINIX_TEST_FLAG", True)
+
+
+def test_env_number_parses_and_defaults(monkeypatch):
+    monkeypatch.delenv("EQUINIX_TEST_NUMBER", raising=False)
+    assert server._env_number("EQUINIX_TEST_NUMBER", 5, int) == 5
+    monkeypatch.setenv("EQUINIX_TEST_NUMBER", "12")
+    assert server._env_number("EQUINIX_TEST_NUMBER", 5, int) == 12
+
+
+def test_env_number_rejects_malformed_values(monkeypatch):
+    monkeypatch.setenv("EQUINIX_TEST_NUMBER", "lots")
+    with pytest.raises(ValueError, match="must be a number"):
+        server._env_number("EQUINIX_TEST_NUMBER", 5, int)
+
+
+def test_env_number_checks_bounds(monkeypatch):
+    monkeypatch.setenv("EQUINIX_TEST_NUMBER", "0")
+    assert server._env_number("EQUINIX_TEST_NUMBER", 5, int, minimum=0) == 0
+    with pytest.raises(ValueError, match="at least 1"):
+        server._env_number("EQUINIX_TEST_NUMBER", 5, int, minimum=1)
+    with pytest.raises(ValueError, match="greater than 0"):
+        server._env_number("EQUINIX_TEST_NUMBER", 5.0, above=0)
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("EQUINIX_HTTP2", "on"),
+        ("EQUINIX_MCP_PRETTY", "pretty"),
+        ("EQUINIX_HTTP_TIMEOUT", "0"),
+        ("EQUINIX_HTTP_TIMEOUT", "-1"),
+        ("EQUINIX_HTTP_MAX_CONNECTIONS", "0"),
+        ("EQUINIX_HTTP_MAX_KEEPALIVE", "-1"),
+        ("EQUINIX_MAX_CONCURRENT_REQUESTS", "0"),
+        ("EQUINIX_MAX_CONCURRENT_REQUESTS", "-2"),
+    ],
+)
+def test_server_refuses_to_start_with_bad_tuning(name, value):
+    result = import_server(**{name: value})
+    assert result.returncode != 0
+    assert f"ValueError: {name} must" in result.stderr
+
+
+def test_server_accepts_boundary_values():
+    result = import_server(
+        EQUINIX_HTTP_TIMEOUT="0.5",
+        EQUINIX_HTTP_MAX_CONNECTIONS="1",
+        EQUINIX_HTTP_MAX_KEEPALIVE="0",
+        EQUINIX_MAX_CONCURRENT_REQUESTS="1",
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,77 @@
+"""Shared HTTP client construction: proxy passthrough from the environment"""
+
+import httpx
+import pytest
+
+import server
+
+PROXY_VARS = ("HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy", "NO_PROXY", "no_proxy")
+
+
+@pytest.fixture(autouse=True)
+def clean_proxy_env(monkeypatch):
+    for name in PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_no_proxy_configured():
+    assert server._env_proxy(server.API_BASE_URL) is None
+
+
+def test_https_proxy_is_used(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    proxy = server._env_proxy(server.API_BASE_URL)
+    assert str(proxy.url) == "http://proxy.example:3128"
+
+
+def test_proxy_without_scheme_defaults_to_http(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "proxy.example:3128")
+    assert str(server._env_proxy(server.API_BASE_URL).url) == "http://proxy.example:3128"
+
+
+def test_all_proxy_is_used_as_fallback(monkeypatch):
+    monkeypatch.setenv("ALL_PROXY", "http://all.example:8080")
+    assert str(server._env_proxy(server.API_BASE_URL).url) == "http://all.example:8080"
+
+
+@pytest.mark.parametrize("no_proxy", [".equinix.com", "api.equinix.com", "*"])
+def test_no_proxy_bypasses_the_proxy(monkeypatch, no_proxy):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.setenv("NO_PROXY", no_proxy)
+    assert server._env_proxy(server.API_BASE_URL) is None
+
+
+async def test_shared_client_transport_carries_the_proxy(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.setattr(server, "_http_client", None)
+    captured = {}
+    real_transport = httpx.AsyncHTTPTransport
+
+    def transport(**kwargs):
+        captured.update(kwargs)
+        return real_transport(**kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", transport)
+    server._get_http_client()
+    try:
+        assert str(captured["proxy"].url) == "http://proxy.example:3128"
+        assert captured["retries"] == server.TRANSPORT_RETRIES
+        assert captured["limits"] is server.HTTP_LIMITS
+    finally:
+        await server._close_http_client()
+
+
+def test_endpoint_constants_are_absolute():
+    urls = [v for k, v in vars(server.EquinixClient).items() if k.startswith("_URL_")]
+    assert urls
+    assert all(url.startswith(f"{server.API_BASE_URL}/fabric/v4/") for url in urls)
+    assert server.OAUTH_URL.startswith(server.API_BASE_URL)
+
+
+async def test_shared_client_has_no_base_url(monkeypatch):
+    monkeypatch.setattr(server, "_http_client", None)
+    http_client = server._get_http_client()
+    try:
+        assert str(http_client.base_url) == ""
+    finally:
+        await server._close_http_client()
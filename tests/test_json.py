@@ -0,0 +1,35 @@
+"""JSON helpers give the same results with and without orjson"""
+
+import pytest
+
+import server
+
+PAYLOAD = {"name": "conn-1", "bandwidth": 50, "tags": ["a", "b"], "nested": {"ok": True}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(server, "orjson", None)
+    elif server.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_request_bodies_are_compact(backend):
+    assert server._json_bytes(PAYLOAD) == (
+        b'{"name":"conn-1","bandwidth":50,"tags":["a","b"],"nested":{"ok":true}}'
+    )
+
+
+def test_responses_round_trip(backend):
+    assert server._json_loads(server._json_bytes(PAYLOAD)) == PAYLOAD
+
+
+def test_tool_results_are_compact_by_default(backend):
+    assert server._json_dumps(PAYLOAD) == server._json_bytes(PAYLOAD).decode()
+
+
+def test_tool_results_can_be_pretty_printed(backend, monkeypatch):
+    monkeypatch.setattr(server, "PRETTY_JSON", True)
+    assert server._json_dumps({"a": [1]}) == '{\n  "a": [\n    1\n  ]\n}'
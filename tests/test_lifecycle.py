@@ -0,0 +1,37 @@
+"""EquinixClient lifecycle: async with, aclose, and the shared connection pool"""
+
+import server
+
+URL = server.EquinixClient._URL_METROS
+
+
+async def test_async_with_leaves_the_shared_pool_open(api, client):
+    async with server.EquinixClient("other-id", "other-secret") as other:
+        await other.make_request("GET", URL)
+
+    assert not server._http_client.is_closed
+    assert await client.make_request("GET", URL) == {}
+
+
+async def test_aclose_drops_cached_token_and_responses(api, client):
+    await client.list_metros()
+    await client.aclose()
+
+    assert client._cached_token() is None
+    await client.list_metros()
+    assert len(api.requests) == 2
+    assert api.token_requests == 2
+
+
+async def test_reset_client_closes_the_pool_and_rebuilds(api, monkeypatch):
+    monkeypatch.setenv("EQUINIX_CLIENT_ID", "id")
+    monkeypatch.setenv("EQUINIX_CLIENT_SECRET", "secret")
+    old = server.EquinixClient("id", "secret")
+    monkeypatch.setattr(server, "equinix_client", old)
+    shared = server._http_client
+
+    new = await server.reset_client()
+
+    assert new is not old
+    assert server.equinix_client is new
+    assert shared.is_closed
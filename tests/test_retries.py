@@ -0,0 +1,83 @@
+"""Status retries with backoff, limited to idempotent methods for gateway errors"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import server
+
+URL = server.EquinixClient._URL_METROS
+
+
+async def test_503_is_retried_until_success(api, client):
+    statuses = [503, 429, 200]
+    api.handler = lambda request: httpx.Response(statuses.pop(0), json={"ok": True})
+
+    assert await client.make_request("GET", URL) == {"ok": True}
+    assert len(api.requests) == 3
+
+
+async def test_post_is_not_retried_on_503(api, client):
+    api.handler = lambda request: httpx.Response(503, json={})
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        await client.make_request("POST", URL, json={"name": "conn"})
+    assert excinfo.value.response.status_code == 503
+    assert len(api.requests) == 1
+
+
+async def test_post_is_retried_on_429(api, client):
+    statuses = [429, 200]
+    api.handler = lambda request: httpx.Response(statuses.pop(0), json={"ok": True})
+
+    assert await client.make_request("POST", URL, json={}) == {"ok": True}
+    assert len(api.requests) == 2
+
+
+def test_retry_after_header_sets_the_delay():
+    response = httpx.Response(429, headers={"retry-after": "7"})
+    assert server._retry_delay(response, attempt=0) == 7.0
+
+
+async def test_retries_stop_after_max_retries(api, client):
+    api.handler = lambda request: httpx.Response(503, json={})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.make_request("GET", URL)
+    assert len(api.requests) == server.MAX_RETRIES + 1
+
+
+async def test_in_flight_requests_are_bounded(api):
+    client = server.EquinixClient("client-id", "client-secret", max_concurrency=2)
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    api.handler = handler
+    await asyncio.gather(*(client.make_request("POST", URL, json={}) for _ in range(6)))
+    assert peak == 2
+    assert len(api.requests) == 6
+
+
+async def test_post_is_not_retried_on_502(api, client):
+    api.handler = lambda request: httpx.Response(502, json={})
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        await client.make_request("POST", URL, json={"filter": {}})
+    assert excinfo.value.response.status_code == 502
+    assert len(api.requests) == 1
+
+
+async def test_get_is_retried_on_502(api, client):
+    statuses = [502, 200]
+    api.handler = lambda request: httpx.Response(statuses.pop(0), json={"ok": True})
+
+    assert await client.make_request("GET", URL) == {"ok": True}
+    assert len(api.requests) == 2
@@ -0,0 +1,72 @@
+"""get_router: direct GET with a fallback to the search endpoint"""
+
+import httpx
+import pytest
+
+import server
+
+ROUTER_URL = f"{server.EquinixClient._URL_ROUTERS}/r1"
+SEARCH_URL = f"{server.EquinixClient._URL_ROUTERS}/search"
+ROUTER = {"uuid": "r1", "name": "edge"}
+
+
+def routes(get_status):
+    """Answer the direct GET with get_status and the search with ROUTER"""
+    def handler(request):
+        if request.method == "GET":
+            if get_status == 200:
+                return httpx.Response(200, json=ROUTER)
+            return httpx.Response(get_status, json={})
+        return httpx.Response(200, json={"data": [ROUTER]})
+    return handler
+
+
+def paths(api):
+    return [(r.method, str(r.url)) for r in api.requests]
+
+
+async def test_direct_get_is_used_when_served(api, client):
+    api.handler = routes(200)
+    assert await client.get_router("r1") == ROUTER
+    assert paths(api) == [("GET", ROUTER_URL)]
+
+
+async def test_404_falls_back_to_search_for_that_call_only(api, client):
+    api.handler = routes(404)
+    assert await client._fetch_router(ROUTER_URL, "r1") == ROUTER
+    assert client._routers_direct_get is True
+
+    api.handler = routes(200)
+    await client._fetch_router(ROUTER_URL, "r1")
+    assert paths(api) == [("GET", ROUTER_URL), ("POST", SEARCH_URL), ("GET", ROUTER_URL)]
+
+
+async def test_405_switches_to_search_for_later_calls(api, client):
+    api.handler = routes(405)
+    assert await client._fetch_router(ROUTER_URL, "r1") == ROUTER
+    assert client._routers_direct_get is False
+
+    await client._fetch_router(ROUTER_URL, "r1")
+    assert paths(api) == [("GET", ROUTER_URL), ("POST", SEARCH_URL), ("POST", SEARCH_URL)]
+
+
+async def test_other_errors_are_not_masked_by_search(api, client):
+    api.handler = routes(403)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_router("r1")
+    assert paths(api) == [("GET", ROUTER_URL)]
+
+
+async def test_router_missing_from_search_raises(api, client):
+    api.handler = lambda request: httpx.Response(
+        404 if request.method == "GET" else 200, json={"data": []}
+    )
+    with pytest.raises(ValueError, match="r1 not found"):
+        await client.get_router("r1")
+
+
+async def test_router_results_are_cached(api, client):
+    api.handler = routes(200)
+    await client.get_router("r1")
+    await client.get_router("r1")
+    assert len(api.requests) == 1
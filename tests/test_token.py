@@ -0,0 +1,51 @@
+"""OAuth token caching, serialized refresh and the refresh-once-on-401 path"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import server
+
+URL = server.EquinixClient._URL_METROS
+
+
+async def test_401_refreshes_token_and_resends_once(api, client):
+    statuses = [401, 200]
+    api.handler = lambda request: httpx.Response(statuses.pop(0), json={"ok": True})
+
+    assert await client.make_request("GET", URL) == {"ok": True}
+    assert api.token_requests == 2
+    assert [r.headers["authorization"] for r in api.requests] == [
+        "Bearer token-1",
+        "Bearer token-2",
+    ]
+
+
+async def test_repeated_401_is_returned_to_the_caller(api, client):
+    api.handler = lambda request: httpx.Response(401, json={})
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        await client.make_request("GET", URL)
+    assert excinfo.value.response.status_code == 401
+    assert len(api.requests) == 2
+
+
+async def test_401_after_exhausted_retries_is_still_resent(api, client):
+    statuses = [503] * server.MAX_RETRIES + [401, 200]
+    api.handler = lambda request: httpx.Response(statuses.pop(0), json={"ok": True})
+
+    assert await client.make_request("GET", URL) == {"ok": True}
+    assert api.requests[-1].headers["authorization"] == "Bearer token-2"
+
+
+async def test_concurrent_callers_share_one_token_request(api, client):
+    tokens = await asyncio.gather(*(client.get_access_token() for _ in range(10)))
+    assert set(tokens) == {"token-1"}
+    assert api.token_requests == 1
+
+
+async def test_cached_token_is_reused_across_requests(api, client):
+    await client.make_request("GET", URL)
+    await client.make_request("POST", URL, json={})
+    assert api.token_requests == 1
@@ -0,0 +1,46 @@
+"""Tool calls through the MCP SDK's CallToolRequest handler"""
+
+from mcp import types
+
+import server
+
+
+async def call(name, arguments):
+    handler = server.app.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments=arguments),
+    )
+    return (await handler(request)).root
+
+
+async def test_missing_required_argument_is_an_error_result():
+    result = await call("get_fabric_port", {})
+    assert result.isError is True
+    assert result.content[0].text == "Input validation error: 'port_id' is a required property"
+
+
+async def test_wrong_argument_type_is_an_error_result():
+    result = await call("get_fabric_port", {"port_id": 5})
+    assert result.isError is True
+    assert result.content[0].text == "Input validation error: 5 is not of type 'string'"
+
+
+def test_validators_are_compiled_for_every_tool():
+    assert set(server._VALIDATORS) == {tool.name for tool in server._TOOLS}
+
+
+async def test_unsupported_tool_skips_client_setup(monkeypatch):
+    async def fail():
+        raise AssertionError("client should not be built")
+
+    monkeypatch.setattr(server, "_get_equinix_client", fail)
+    result = await call("get_connection_stats", {"connection_id": "c1"})
+    assert "not supported" in result.content[0].text
+
+
+async def test_valid_call_returns_the_api_result(api, monkeypatch):
+    monkeypatch.setattr(server, "equinix_client", server.EquinixClient("id", "secret"))
+    result = await call("list_metros", {})
+    assert result.isError is False
+    assert result.content[0].text == "{}"